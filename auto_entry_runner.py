@@ -17,15 +17,31 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from openpyxl import load_workbook
 
-from autofill_core import FillAction, load_json, perform_autofill
-from state_utils import load_state, save_state
+from autofill_core import (
+    DriverSetupError,
+    FillAction,
+    create_driver,
+    load_json,
+    perform_autofill,
+    reset_session,
+    session_alive,
+)
+from state_utils import append_state
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # optional accelerator (pip install pyahocorasick)
+    ahocorasick = None
 
 logger = logging.getLogger("auto_entry_runner")
 
+# Below this many targets a plain substring scan is cheaper than an automaton.
+AUTOMATON_MIN_TARGETS = 8
+
 
 @dataclass
 class AutomationTarget:
@@ -39,6 +55,27 @@ class AutomationTarget:
         return self.match in link
 
 
+class TargetMatcher:
+    """Resolve a link to the first target (in file order) whose substring it contains."""
+
+    def __init__(self, targets: Sequence[AutomationTarget]) -> None:
+        self.targets = list(targets)
+        self._automaton = None
+        if ahocorasick is not None and len(self.targets) >= AUTOMATON_MIN_TARGETS:
+            automaton = ahocorasick.Automaton()
+            for index, target in enumerate(self.targets):
+                if not automaton.exists(target.match):
+                    automaton.add_word(target.match, index)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def match(self, link: str) -> Optional[AutomationTarget]:
+        if self._automaton is None:
+            return next((t for t in self.targets if t.matches(link)), None)
+        index = min((idx for _, idx in self._automaton.iter(link)), default=None)
+        return None if index is None else self.targets[index]
+
+
 def load_targets(path: Path) -> List[AutomationTarget]:
     if not path.exists():
         raise FileNotFoundError(f"Automation target file not found: {path}")
@@ -67,7 +104,7 @@ def load_targets(path: Path) -> List[AutomationTarget]:
     return targets
 
 
-def auto_confirm(actions: List[FillAction], screenshot_path: Path, *, always_yes: bool) -> bool:
+def auto_confirm(actions: List[FillAction], screenshot_path: Optional[Path], *, always_yes: bool) -> bool:
     print("\n=== Autofill preview ===")
     for action in actions:
         label = (action.label or "<no label>").strip()
@@ -75,7 +112,8 @@ def auto_confirm(actions: List[FillAction], screenshot_path: Path, *, always_yes
             f"- label='{label[:60]}' type={action.input_type} key={action.mapped_key} "
             f"filled={action.filled} value={action.value}"
         )
-    print(f"Screenshot -> {screenshot_path}")
+    if screenshot_path:
+        print(f"Screenshot -> {screenshot_path}")
     if always_yes:
         print("Auto-confirm enabled; submitting.")
         return True
@@ -95,72 +133,139 @@ def run(
     if not targets:
         logger.warning("No automation targets defined; nothing to do.")
         return []
+    matcher = TargetMatcher(targets)
 
-    wb = load_workbook(workbook_path)
-    ws = wb.active
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    try:
-        link_idx = headers.index("Link")
-        status_idx = headers.index("Successful Submission")
-    except ValueError as exc:
-        raise ValueError("Spreadsheet missing expected columns (Link / Successful Submission).") from exc
+    # Scan pass: read-only + values_only avoids building styled Cell objects for
+    # the whole sheet when we only need the Link column.
+    wb = load_workbook(workbook_path, read_only=True, data_only=True)
     try:
-        new_idx = headers.index("Is New This Run")
-    except ValueError:
-        new_idx = -1
+        ws = wb.active
+        # An empty sheet has no header row; fall through to the missing-columns error.
+        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        columns = {name: idx for idx, name in enumerate(header_row)}
+        try:
+            link_idx = columns["Link"]
+            status_idx = columns["Successful Submission"]
+        except KeyError as exc:
+            raise ValueError("Spreadsheet missing expected columns (Link / Successful Submission).") from exc
+        new_idx = columns.get("Is New This Run", -1)
+
+        matches: List[Tuple[int, str, AutomationTarget]] = []
+        for row_index, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
+            # Read-only sheets without stored dimensions drop trailing empty cells,
+            # so rows can be shorter than the header.
+            link = (row[link_idx] if link_idx < len(row) else None) or ""
+            if not link:
+                continue
+            target = matcher.match(link)
+            if not target:
+                continue
+            if limit is not None and len(matches) >= limit:
+                break
+            matches.append((row_index, link, target))
+    finally:
+        wb.close()
+
+    if not dry_run and matches:
+        # Parse each config/data file once; rows overlay their own fields on a copy.
+        configs = {t.config_path: load_json(t.config_path) for _, _, t in matches}
+        datas = {t.data_path: load_json(t.data_path) for _, _, t in matches}
 
     processed = 0
-    successes = 0
+    submitted_rows: List[int] = []
     submitted_links: List[str] = []
-    for row in ws.iter_rows(min_row=2):
-        link = row[link_idx].value or ""
-        if not link:
-            continue
-        target = next((t for t in targets if t.matches(link)), None)
-        if not target:
-            continue
+    # Rows share one browser session while their browser-level options agree; a row
+    # that needs a different (headless, webdriver_path) pair gets a new session.
+    driver = None
+    driver_options: Optional[Tuple[bool, Optional[str]]] = None
+    try:
+        for row_index, link, target in matches:
+            processed += 1
+            logger.info("Processing competition %s", link)
 
-        if limit is not None and processed >= limit:
-            break
+            if dry_run:
+                print(f"[DRY RUN] Would submit: {link} using {target.config_path}")
+                continue
 
-        processed += 1
-        logger.info("Processing competition %s", link)
+            cfg = dict(configs[target.config_path], url=link)
+            data = datas[target.data_path]
+            if target.screenshot_dir:
+                target.screenshot_dir.mkdir(parents=True, exist_ok=True)
+                cfg["screenshot_dir"] = str(target.screenshot_dir)
+            if target.submit_selector:
+                cfg["submit_selector"] = target.submit_selector
+            if auto_yes:
+                # Nobody is reviewing the form, so pacing the fill and the
+                # pre-submit preview screenshot buy nothing.
+                cfg["human_delay_seconds"] = [0, 0]
+                cfg["skip_preview_screenshot"] = True
 
-        if dry_run:
-            print(f"[DRY RUN] Would submit: {link} using {target.config_path}")
-            continue
+            options = _browser_options(cfg)
+            if driver is not None and options != driver_options:
+                logger.info("Browser options changed to %s; starting a new Chrome session.", options)
+                _quit_quietly(driver)
+                driver = None
+            elif driver is not None and not session_alive(driver):
+                # A crashed browser would fail every remaining row; start a new one.
+                logger.warning("Browser session lost; starting a new Chrome session.")
+                _quit_quietly(driver)
+                driver = None
 
-        cfg = load_json(target.config_path)
-        data = load_json(target.data_path)
-        cfg["url"] = link
-        if target.screenshot_dir:
-            target.screenshot_dir.mkdir(parents=True, exist_ok=True)
-            cfg["screenshot_dir"] = str(target.screenshot_dir)
-        if target.submit_selector:
-            cfg["submit_selector"] = target.submit_selector
-
-        outcome = perform_autofill(
-            cfg,
-            data,
-            confirm_submit=lambda actions, screenshot: auto_confirm(actions, screenshot, always_yes=auto_yes),
-        )
+            if driver is None:
+                try:
+                    driver = create_driver(cfg)
+                except DriverSetupError as exc:
+                    logger.error("%s", exc)
+                    break
+                driver_options = options
+            else:
+                reset_session(driver)
+
+            outcome = perform_autofill(
+                cfg,
+                data,
+                confirm_submit=lambda actions, screenshot: auto_confirm(actions, screenshot, always_yes=auto_yes),
+                driver=driver,
+            )
 
-        if outcome.submitted:
-            successes += 1
-            submitted_links.append(link)
-            row[status_idx].value = "Yes"
-            if new_idx >= 0:
-                row[new_idx].value = (row[new_idx].value or "").replace("YES", "").strip()
-        else:
-            row[status_idx].value = row[status_idx].value or ""
-
-    if not dry_run:
-        wb.save(workbook_path)
-        logger.info("Updated spreadsheet with %d successful submissions.", successes)
-    logger.info("Processed %d competitions (%d successes).", processed, successes)
+            if outcome.submitted:
+                submitted_rows.append(row_index)
+                submitted_links.append(link)
+    finally:
+        if driver is not None:
+            _quit_quietly(driver)
+        # The workbook is only held in memory for the final write, not for the
+        # whole (potentially hours-long) Selenium session.
+        if submitted_rows:
+            _mark_submitted(workbook_path, submitted_rows, status_idx, new_idx)
+    logger.info("Processed %d competitions (%d successes).", processed, len(submitted_rows))
     return submitted_links
 
 
+def _browser_options(cfg: dict) -> Tuple[bool, Optional[str]]:
+    """The config fields create_driver reads; rows that differ here need their own session."""
+    return bool(cfg.get("headless", False)), cfg.get("webdriver_path") or None
+
+
+def _quit_quietly(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:  # the session is already gone; nothing left to release
+        logger.debug("Ignoring error while quitting a dead driver", exc_info=True)
+
+
+def _mark_submitted(workbook_path: Path, rows: Sequence[int], status_idx: int, new_idx: int) -> None:
+    wb = load_workbook(workbook_path)
+    ws = wb.active
+    for row_index in rows:
+        ws.cell(row=row_index, column=status_idx + 1).value = "Yes"
+        if new_idx >= 0:
+            new_cell = ws.cell(row=row_index, column=new_idx + 1)
+            new_cell.value = (new_cell.value or "").replace("YES", "").strip()
+    wb.save(workbook_path)
+    logger.info("Updated spreadsheet with %d successful submissions.", len(rows))
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Automate competition entries for whitelisted targets.")
     parser.add_argument(
@@ -225,10 +330,7 @@ def main(argv: Optional[List[str]] = None) -> None:
     if submitted:
         logger.info("Successfully submitted %d competitions.", len(submitted))
     if submitted and not args.dry_run and args.state:
-        state = load_state(args.state)
-        state.submitted.update(submitted)
-        state.seen.update(submitted)
-        save_state(args.state, state)
+        append_state(args.state, seen=submitted, submitted=submitted)
 
 
 if __name__ == "__main__":
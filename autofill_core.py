@@ -6,21 +6,23 @@ Encapsulates Selenium setup, heuristic field matching, and submission workflow.
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 import logging
 import random
+import re
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
 
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from json_utils import dumps_json, loads_json  # noqa: F401  (dumps_json is re-exported)
+
+# Selenium is imported inside the functions that drive a browser so that dry runs,
+# --help and the pure helpers (load_json, score_field, ...) skip its import cost.
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # --- Logging setup ---
 logger = logging.getLogger("autofill")
@@ -47,6 +49,20 @@ class AutofillOutcome:
     submitted: bool = False
     aborted_reason: Optional[str] = None
     error: Optional[str] = None
+    # Screenshot files still being written in the background.
+    pending_writes: List[concurrent.futures.Future] = field(default_factory=list)
+
+    def wait_for_screenshots(self) -> None:
+        """Block until all screenshot files for this outcome are on disk."""
+        concurrent.futures.wait(self.pending_writes)
+
+
+class DriverSetupError(RuntimeError):
+    """Raised when Chrome/ChromeDriver cannot be started."""
+
+
+# Screenshot PNGs are written to disk off the WebDriver thread.
+_SCREENSHOT_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot")
 
 
 # --- Heuristics: keywords mapped to data keys ---
@@ -62,85 +78,212 @@ FIELD_KEYWORDS: Dict[str, Sequence[str]] = {
     "name": ["name", "full name"],
 }
 
+
+def _build_keyword_matcher() -> tuple[re.Pattern[str], Dict[str, tuple[str, str, int]]]:
+    """Compile FIELD_KEYWORDS into one lookahead alternation.
+
+    The zero-width lookahead reports a match at every position (overlaps included),
+    longest keyword first, so score_field sees the same candidates as a per-keyword
+    substring scan. Each group maps back to (key, keyword, declaration order).
+    """
+    ordered = [
+        (key, keyword)
+        for key, keywords in FIELD_KEYWORDS.items()
+        for keyword in keywords
+    ]
+    groups: Dict[str, tuple[str, str, int]] = {}
+    alternatives = []
+    for order, (key, keyword) in sorted(enumerate(ordered), key=lambda item: -len(item[1][1])):
+        name = f"k{order}"
+        groups[name] = (key, keyword, order)
+        alternatives.append(f"(?P<{name}>{re.escape(keyword)})")
+    return re.compile("(?=" + "|".join(alternatives) + ")"), groups
+
+
+_KEYWORD_RE, _KEYWORD_GROUPS = _build_keyword_matcher()
+
 # Order to attempt for text inputs (prefer type=email / tel)
 INPUT_TYPES_PRIORITY = ["email", "tel", "text", "search", "url"]
 
+# Input types that map straight to a data key without label heuristics.
+TYPED_INPUT_KEYS = {"email": "email", "tel": "phone", "url": "website"}
+TYPED_INPUT_SCORE = 99
+
+INPUT_SELECTOR = "input, textarea, select"
+DEFAULT_SUBMIT_SELECTOR = "button[type='submit'], input[type='submit'], button"
+
+# Gathers every visible form control and its label hints in one WebDriver round-trip
+# instead of several get_attribute/find_element calls per element. `idx` is the
+# element's position in document.querySelectorAll(INPUT_SELECTOR).
+# The visibility test mirrors what is_displayed() used to reject, including the usual
+# honeypot tricks: opacity:0 (on the field or an ancestor), a hidden ancestor, and
+# fields pushed off-page with negative offsets.
+_HARVEST_FN = """(selector) => {
+  const root = document.documentElement;
+  const docWidth = Math.max(root.scrollWidth, root.clientWidth);
+  const docHeight = Math.max(root.scrollHeight, root.clientHeight);
+  const isHidden = (el) => {
+    const rect = el.getBoundingClientRect();
+    if (rect.width <= 0 || rect.height <= 0) return true;
+    const left = rect.left + window.scrollX;
+    const top = rect.top + window.scrollY;
+    if (left + rect.width <= 0 || top + rect.height <= 0 || left >= docWidth || top >= docHeight) return true;
+    const style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') return true;
+    if (el.offsetParent === null && style.position !== 'fixed') return true;
+    if (typeof el.checkVisibility === 'function') {
+      return !el.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    }
+    for (let node = el.parentElement; node; node = node.parentElement) {
+      if (window.getComputedStyle(node).opacity === '0') return true;
+    }
+    return false;
+  };
+  const result = [];
+  document.querySelectorAll(selector).forEach((el, idx) => {
+    if (isHidden(el)) {
+      return;
+    }
+    let label = '';
+    if (el.id) {
+      const labelEl = document.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+      label = labelEl ? (labelEl.innerText || '') : '';
+    }
+    result.push({
+      idx: idx,
+      tag: el.tagName.toLowerCase(),
+      type: (el.type || '').toLowerCase(),
+      aria: el.getAttribute('aria-label') || '',
+      placeholder: el.getAttribute('placeholder') || '',
+      name: el.getAttribute('name') || '',
+      id: el.id || '',
+      label: label,
+    });
+  });
+  return result;
+}"""
+_HARVEST_JS = f"return ({_HARVEST_FN})(arguments[0]);"
+# Same harvest as a DevTools Runtime.evaluate expression, which skips the W3C
+# WebDriver result marshalling on Chrome.
+_HARVEST_CDP_EXPR = f"({_HARVEST_FN})({json.dumps(INPUT_SELECTOR)})"
+
+_PAGE_READY_JS = "return document.readyState === 'complete' && document.body !== null;"
+
+# Detects CAPTCHA widgets in the live DOM rather than transferring and lowercasing
+# the whole page source. The `i` flag makes the attribute matches case-insensitive.
+_CAPTCHA_JS = """
+return document.querySelector(
+  '[class*="captcha" i], [id*="captcha" i], [data-sitekey], '
+  + 'iframe[src*="captcha" i], script[src*="captcha" i]'
+) !== null;
+"""
+
+# Sets every mapped value in one call and fires input/change events so page scripts
+# notice. Used when cfg["fast_fill"] is true; returns a success flag per item.
+_FAST_FILL_JS = """
+const controls = document.querySelectorAll(arguments[0]);
+return arguments[1].map(([idx, value]) => {
+  const el = controls[idx];
+  if (!el) {
+    return false;
+  }
+  el.focus();
+  el.value = value;
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  return true;
+});
+"""
+
+SUBMIT_KEYWORDS = ("submit", "enter", "confirm", "join", "register")
+
+
+def _build_submit_fallback_xpath() -> str:
+    """XPath for buttons / submit inputs whose text or value contains a SUBMIT_KEYWORDS entry."""
+
+    def contains_keyword(expr: str) -> str:
+        lowered = f"translate({expr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+        return " or ".join(f"contains({lowered}, '{keyword}')" for keyword in SUBMIT_KEYWORDS)
+
+    return (
+        f"//button[{contains_keyword('.')} or {contains_keyword('@value')}]"
+        f" | //input[@type='submit'][{contains_keyword('@value')}]"
+    )
+
+
+# Filtering happens inside the browser, so the fallback is one round-trip regardless
+# of how many buttons the page has.
+_SUBMIT_FALLBACK_XPATH = _build_submit_fallback_xpath()
+
 
 def load_json(path: Path | str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+    # Read bytes so the parser (orjson when installed) skips a separate decode pass.
+    with open(path, "rb") as handle:
+        return loads_json(handle.read())
 
 
 def human_delay(min_seconds: float = 0.5, max_seconds: float = 1.5) -> None:
     time.sleep(random.uniform(min_seconds, max_seconds))
 
 
-def find_visible_inputs(driver: webdriver.Chrome) -> List[Any]:
-    ensure_active_window(driver)
-    inputs = driver.find_elements(By.CSS_SELECTOR, "input, textarea, select")
-    visible = []
-    for element in inputs:
-        try:
-            if (
-                element.is_displayed()
-                and element.size.get("height", 0) > 0
-                and element.size.get("width", 0) > 0
-            ):
-                visible.append(element)
-        except Exception:
-            continue
-    return visible
-
+def find_visible_inputs(driver: webdriver.Chrome) -> List[Dict[str, Any]]:
+    """Return metadata for every visible form control using a single script evaluation.
 
-def element_label_text(driver: webdriver.Chrome, element: Any) -> str:
-    """Try multiple ways to get a label for the element for heuristic matching."""
+    Callers are expected to have checked the window with ensure_active_window.
+    """
     try:
-        aria = element.get_attribute("aria-label") or ""
-        placeholder = element.get_attribute("placeholder") or ""
-        name = element.get_attribute("name") or ""
-        element_id = element.get_attribute("id") or ""
-        label_text = ""
+        result = driver.execute_cdp_cmd(
+            "Runtime.evaluate", {"expression": _HARVEST_CDP_EXPR, "returnByValue": True}
+        )
+        return result["result"]["value"] or []
+    except Exception:
+        # Not a Chromium driver, or the evaluation failed: use the WebDriver route.
+        logger.debug("CDP input harvest unavailable; falling back to execute_script", exc_info=True)
+    return driver.execute_script(_HARVEST_JS, INPUT_SELECTOR) or []
 
-        if element_id:
-            try:
-                label_el = driver.find_element(By.CSS_SELECTOR, f"label[for='{element_id}']")
-                label_text = (label_el.text or label_el.get_attribute("innerText") or "")
-            except NoSuchElementException:
-                label_text = ""
 
-        combined = " ".join([aria, placeholder, label_text, name, element_id]).strip()
-        return combined.lower()
-    except Exception:
-        return ""
+def element_label_text(meta: Dict[str, Any]) -> str:
+    """Combine the harvested label hints for an input into one string for heuristic matching."""
+    parts = [meta.get(key) or "" for key in ("aria", "placeholder", "label", "name", "id")]
+    return " ".join(parts).strip().lower()
 
 
 def score_field(label_lower: str) -> tuple[Optional[str], int]:
     """Return (best_match_key, score) where higher score = more confident."""
     best_key = None
     best_score = 0
+    best_order = 0
     if not label_lower:
         return None, 0
-    for key, keywords in FIELD_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in label_lower:
-                score = len(keyword) + (2 if label_lower.startswith(keyword) else 0)
-                if score > best_score:
-                    best_score = score
-                    best_key = key
+    for match in _KEYWORD_RE.finditer(label_lower):
+        key, keyword, order = _KEYWORD_GROUPS[match.lastgroup]
+        score = len(keyword) + (2 if match.start() == 0 else 0)
+        # Ties go to the keyword declared first, as in FIELD_KEYWORDS order.
+        if score > best_score or (score == best_score and best_key is not None and order < best_order):
+            best_score = score
+            best_key = key
+            best_order = order
     return best_key, best_score
 
 
+def with_derived_names(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of data with first/last name split from "name" (or "name" joined from them)."""
+    derived = dict(data)
+    parts = str(derived.get("name") or "").split()
+    if parts:
+        if not derived.get("first_name"):
+            derived["first_name"] = parts[0]
+        if not derived.get("last_name"):
+            derived["last_name"] = parts[-1] if len(parts) > 1 else ""
+    elif "first_name" in derived and "last_name" in derived:
+        derived["name"] = f"{derived['first_name']} {derived['last_name']}".strip()
+    return derived
+
+
 def choose_value_for_field(key: str, data: Dict[str, Any]) -> Optional[str]:
-    if key in data and data[key]:
-        return str(data[key])
-    if key == "first_name" and "name" in data:
-        return str(data["name"]).split()[0]
-    if key == "last_name" and "name" in data:
-        parts = str(data["name"]).split()
-        return parts[-1] if len(parts) > 1 else ""
-    if key == "name" and "first_name" in data and "last_name" in data:
-        return f"{data['first_name']} {data['last_name']}".strip()
-    return None
+    """Value for key, expecting data already passed through with_derived_names."""
+    value = data.get(key)
+    return str(value) if value else None
 
 
 def safe_send_keys(element: Any, value: str) -> bool:
@@ -156,6 +299,19 @@ def safe_send_keys(element: Any, value: str) -> bool:
         return False
 
 
+def _write_screenshot(driver: webdriver.Chrome, path: Path) -> concurrent.futures.Future:
+    """Grab a PNG from the browser and write it to path in the background."""
+    png = driver.get_screenshot_as_png()
+    future = _SCREENSHOT_POOL.submit(path.write_bytes, png)
+
+    def report_failure(done: concurrent.futures.Future) -> None:
+        if done.exception() is not None:
+            logger.warning("Failed to write screenshot %s: %s", path, done.exception())
+
+    future.add_done_callback(report_failure)
+    return future
+
+
 def _status(message: str, status_callback: Optional[Callable[[str], None]]) -> None:
     logger.info(message)
     if status_callback:
@@ -164,41 +320,131 @@ def _status(message: str, status_callback: Optional[Callable[[str], None]]) -> N
         except Exception:
             logger.debug("Status callback raised", exc_info=True)
 
-def ensure_active_window(driver: webdriver.Chrome, wait_seconds: float = 5.0) -> None:
-    """Ensure Selenium is focused on a valid, open window."""
-    end_time = time.time() + wait_seconds
-    while True:
-        try:
-            _ = driver.current_window_handle  # access to confirm window is alive
-            return
-        except WebDriverException:
-            handles = driver.window_handles
-            if handles:
-                for handle in reversed(handles):
-                    try:
-                        driver.switch_to.window(handle)
-                        _ = driver.current_window_handle
-                        return
-                    except WebDriverException:
-                        continue
-        if time.time() > end_time:
+def ensure_active_window(driver: webdriver.Chrome) -> None:
+    """Ensure Selenium is focused on a valid, open window (switching to the newest if not)."""
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        driver.current_window_handle  # raises if the focused window has gone away
+        return
+    except WebDriverException:
+        handles = driver.window_handles
+        if not handles:
             raise
-        time.sleep(0.2)
+    driver.switch_to.window(handles[-1])
+
+
+def create_driver(
+    cfg: Dict[str, Any],
+    status_callback: Optional[Callable[[str], None]] = None,
+) -> webdriver.Chrome:
+    """Launch Chrome using the browser options in cfg (headless, webdriver_path).
+
+    Raises DriverSetupError with a user-facing message when no driver can be started.
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_opts = Options()
+    if cfg.get("headless", False):
+        chrome_opts.add_argument("--headless=new")
+    chrome_opts.add_argument("--start-maximized")
+    chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
+
+    webdriver_path = cfg.get("webdriver_path")
+    try:
+        if webdriver_path:
+            return webdriver.Chrome(service=Service(webdriver_path), options=chrome_opts)
+        return webdriver.Chrome(options=chrome_opts)
+    except WebDriverException as exc:
+        msg = str(exc).lower()
+        if "unable to obtain driver" not in msg and "driver location" not in msg:
+            raise DriverSetupError(f"WebDriver error: {exc}") from exc
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager  # type: ignore
+
+            _status("Attempting to download ChromeDriver via webdriver_manager...", status_callback)
+            return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_opts)
+        except ImportError:
+            raise DriverSetupError(
+                "webdriver_manager is not installed. Install it with `pip install webdriver-manager` "
+                "or provide 'webdriver_path' in config.json."
+            ) from exc
+        except Exception as mgr_exc:  # pragma: no cover - fallback path
+            raise DriverSetupError(
+                "WebDriver error: failed to locate ChromeDriver automatically. "
+                "Install ChromeDriver manually or set 'webdriver_path' in config.\n"
+                f"Original error: {exc}\nwebdriver_manager: {mgr_exc}"
+            ) from mgr_exc
+
+
+def reset_session(driver: webdriver.Chrome) -> None:
+    """Clear cookies and site storage so a reused driver starts the next form fresh.
+
+    Cookies are dropped browser-wide through DevTools. Storage (localStorage,
+    IndexedDB, cache, service workers, ...) is cleared for every http(s) origin in
+    any window's history, and windows the previous form opened are closed.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        handles = driver.window_handles
+        origins = set()
+        for handle in handles:
+            driver.switch_to.window(handle)
+            history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+            for entry in history.get("entries", []):
+                parts = urlsplit(entry.get("url", ""))
+                if parts.scheme in ("http", "https"):
+                    origins.add(f"{parts.scheme}://{parts.netloc}")
+            if handle != handles[0]:
+                driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Page.resetNavigationHistory", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    except WebDriverException:
+        logger.debug("Failed to reset browser session", exc_info=True)
+
+
+def session_alive(driver: webdriver.Chrome) -> bool:
+    """Return False once Chrome has crashed or the WebDriver session is no longer valid."""
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        return bool(driver.window_handles)
+    except WebDriverException:
+        return False
 
 
 def perform_autofill(
     cfg: Dict[str, Any],
     data: Dict[str, Any],
-    confirm_submit: Optional[Callable[[List[FillAction], Path], bool]] = None,
+    confirm_submit: Optional[Callable[[List[FillAction], Optional[Path]], bool]] = None,
     status_callback: Optional[Callable[[str], None]] = None,
+    driver: Optional[webdriver.Chrome] = None,
 ) -> AutofillOutcome:
     """
     Execute the autofill workflow.
 
     confirm_submit is invoked with the list of FillAction entries and the pre-submit
-    screenshot path. It should return True to proceed, False to abort.
+    screenshot path (None when cfg["skip_preview_screenshot"] is set). It should
+    return True to proceed, False to abort. Screenshots are written in the
+    background; call outcome.wait_for_screenshots() if the files must exist.
+
+    When driver is given the session is reused and left open for the caller to
+    quit; otherwise a browser is launched for this run and closed afterwards.
     """
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
     outcome = AutofillOutcome(fill_actions=[])
+    data = with_derived_names(data)
 
     url = cfg.get("url", "").strip()
     if not url:
@@ -208,58 +454,29 @@ def perform_autofill(
 
     headless = bool(cfg.get("headless", False))
     wait_timeout = int(cfg.get("wait_timeout", 10))
-    submit_selector = cfg.get("submit_selector") or "button[type='submit'], input[type='submit'], button"
+    submit_selector = cfg.get("submit_selector") or DEFAULT_SUBMIT_SELECTOR
     human_delay_bounds = cfg.get("human_delay_seconds", [0.4, 1.0])
     if not isinstance(human_delay_bounds, (list, tuple)) or len(human_delay_bounds) != 2:
         human_delay_bounds = [0.4, 1.0]
     human_delay_bounds = [float(human_delay_bounds[0]), float(human_delay_bounds[1])]
     if human_delay_bounds[0] > human_delay_bounds[1]:
         human_delay_bounds.sort()
+    # [0, 0] disables pauses entirely (no random draw or sleep syscall per field).
+    delay_enabled = human_delay_bounds[1] > 0
 
     screenshot_dir = Path(cfg.get("screenshot_dir") or Path.cwd())
     screenshot_dir.mkdir(parents=True, exist_ok=True)
 
     pause_on_captcha = bool(cfg.get("pause_on_captcha", False))
+    fast_fill = bool(cfg.get("fast_fill", False))
+    skip_preview_screenshot = bool(cfg.get("skip_preview_screenshot", False))
 
-    chrome_opts = Options()
-    if headless:
-        chrome_opts.add_argument("--headless=new")
-    chrome_opts.add_argument("--start-maximized")
-    chrome_opts.add_argument("--disable-blink-features=AutomationControlled")
-
-    driver = None
-    driver = None
-    webdriver_path = cfg.get("webdriver_path")
-    try:
-        if webdriver_path:
-            driver = webdriver.Chrome(service=Service(webdriver_path), options=chrome_opts)
-        else:
-            driver = webdriver.Chrome(options=chrome_opts)
-    except WebDriverException as exc:
-        msg = str(exc).lower()
-        if "unable to obtain driver" in msg or "driver location" in msg:
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager  # type: ignore
-
-                _status("Attempting to download ChromeDriver via webdriver_manager...", status_callback)
-                driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_opts)
-            except ImportError:
-                outcome.error = (
-                    "webdriver_manager is not installed. Install it with `pip install webdriver-manager` "
-                    "or provide 'webdriver_path' in config.json."
-                )
-                _status(outcome.error, status_callback)
-                return outcome
-            except Exception as mgr_exc:  # pragma: no cover - fallback path
-                outcome.error = (
-                    "WebDriver error: failed to locate ChromeDriver automatically. "
-                    "Install ChromeDriver manually or set 'webdriver_path' in config.\n"
-                    f"Original error: {exc}\nwebdriver_manager: {mgr_exc}"
-                )
-                _status(outcome.error, status_callback)
-                return outcome
-        else:
-            outcome.error = f"WebDriver error: {exc}"
+    owns_driver = driver is None
+    if owns_driver:
+        try:
+            driver = create_driver(cfg, status_callback)
+        except DriverSetupError as exc:
+            outcome.error = str(exc)
             _status(outcome.error, status_callback)
             return outcome
 
@@ -274,8 +491,23 @@ def perform_autofill(
             outcome.error = f"WebDriver window error: {exc}"
             _status(outcome.error, status_callback)
             return outcome
-        WebDriverWait(driver, wait_timeout).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        human_delay(*human_delay_bounds)
+        WebDriverWait(driver, wait_timeout).until(lambda d: d.execute_script(_PAGE_READY_JS))
+
+        # Check for CAPTCHAs up front so guarded pages skip the input scan and
+        # screenshot. Only a visible browser with pause_on_captcha carries on, since
+        # the user needs the filled form in front of them to solve it by hand; that
+        # happens at the re-check just before submit.
+        captcha_detected = bool(driver.execute_script(_CAPTCHA_JS))
+        solve_captcha_manually = pause_on_captcha and not headless
+        if captcha_detected and not solve_captcha_manually:
+            outcome.aborted_reason = "CAPTCHA-like content detected; submission skipped."
+            _status(outcome.aborted_reason, status_callback)
+            if pause_on_captcha:
+                _status("Headless mode prevents manual CAPTCHA solving. Consider setting headless=false.", status_callback)
+            return outcome
+
+        if delay_enabled:
+            human_delay(*human_delay_bounds)
 
         try:
             visible_inputs = find_visible_inputs(driver)
@@ -285,16 +517,24 @@ def perform_autofill(
             return outcome
         _status(f"Found {len(visible_inputs)} visible inputs", status_callback)
 
-        for element in visible_inputs:
-            tag = element.tag_name.lower()
-            input_type = (element.get_attribute("type") or "").lower()
+        elements: Optional[List[Any]] = None
+        # (fill_actions index, element idx, value) filled together when fast_fill is on.
+        pending_fills: List[tuple[int, int, str]] = []
+        for meta in visible_inputs:
+            tag = meta["tag"]
+            input_type = meta["type"]
             if tag == "textarea":
                 input_type = "textarea"
 
-            label_text = element_label_text(driver, element)
-            key_candidate, score = score_field(label_text)
-            if input_type in INPUT_TYPES_PRIORITY:
-                score += len(INPUT_TYPES_PRIORITY) - INPUT_TYPES_PRIORITY.index(input_type)
+            label_text = element_label_text(meta)
+            typed_key = TYPED_INPUT_KEYS.get(input_type)
+            if typed_key and choose_value_for_field(typed_key, data):
+                # The input type alone identifies the field; skip keyword scoring.
+                key_candidate, score = typed_key, TYPED_INPUT_SCORE
+            else:
+                key_candidate, score = score_field(label_text)
+                if input_type in INPUT_TYPES_PRIORITY:
+                    score += len(INPUT_TYPES_PRIORITY) - INPUT_TYPES_PRIORITY.index(input_type)
 
             if tag == "select" and score < 3:
                 outcome.fill_actions.append(
@@ -306,18 +546,34 @@ def perform_autofill(
             filled = False
             if score >= 3 and key_candidate:
                 value = choose_value_for_field(key_candidate, data)
-                if value:
-                    filled = safe_send_keys(element, value)
-                    human_delay(*human_delay_bounds)
+                if value and fast_fill:
+                    pending_fills.append((len(outcome.fill_actions), meta["idx"], value))
+                elif value:
+                    # WebElements are only fetched once a field actually needs filling.
+                    if elements is None:
+                        elements = driver.find_elements(By.CSS_SELECTOR, INPUT_SELECTOR)
+                    if meta["idx"] < len(elements):
+                        filled = safe_send_keys(elements[meta["idx"]], value)
+                    if delay_enabled:
+                        human_delay(*human_delay_bounds)
             outcome.fill_actions.append(
                 FillAction(label_text, tag, input_type, key_candidate, value, score, filled)
             )
 
+        if pending_fills:
+            results = driver.execute_script(
+                _FAST_FILL_JS, INPUT_SELECTOR, [[idx, value] for _, idx, value in pending_fills]
+            )
+            for (action_index, _, _), filled in zip(pending_fills, results or []):
+                outcome.fill_actions[action_index].filled = bool(filled)
+
         timestamp = int(time.time())
-        screenshot_path = screenshot_dir / f"autofill_preview_{timestamp}.png"
-        driver.save_screenshot(str(screenshot_path))
-        outcome.screenshot_path = screenshot_path
-        _status(f"Saved snapshot for review: {screenshot_path}", status_callback)
+        screenshot_path = None
+        if not skip_preview_screenshot:
+            screenshot_path = screenshot_dir / f"autofill_preview_{timestamp}.png"
+            outcome.pending_writes.append(_write_screenshot(driver, screenshot_path))
+            outcome.screenshot_path = screenshot_path
+            _status(f"Saved snapshot for review: {screenshot_path}", status_callback)
 
         if confirm_submit:
             should_submit = confirm_submit(outcome.fill_actions, screenshot_path)
@@ -326,8 +582,22 @@ def perform_autofill(
                 _status("Submission cancelled; exiting without submit.", status_callback)
                 return outcome
 
-        page_html = driver.page_source.lower()
-        if any(token in page_html for token in ("recaptcha", "g-recaptcha", "captcha")):
+        submit_element = driver.execute_script("return document.querySelector(arguments[0]);", submit_selector)
+        if submit_element is None:
+            candidates = driver.find_elements(By.XPATH, _SUBMIT_FALLBACK_XPATH)
+            submit_element = candidates[0] if candidates else None
+
+        if not submit_element:
+            outcome.aborted_reason = f"Submit button not found using selector '{submit_selector}'."
+            _status(outcome.aborted_reason, status_callback)
+            return outcome
+
+        if delay_enabled:
+            human_delay(*human_delay_bounds)
+
+        # Re-check just before clicking: challenges such as a reCAPTCHA v2 popup or a
+        # late-loading hCaptcha iframe only appear once the form has been filled.
+        if driver.execute_script(_CAPTCHA_JS):
             outcome.aborted_reason = "CAPTCHA-like content detected; submission skipped."
             _status(outcome.aborted_reason, status_callback)
             if pause_on_captcha:
@@ -346,28 +616,11 @@ def perform_autofill(
                         pass
             return outcome
 
-        submit_element = None
-        try:
-            submit_element = driver.find_element(By.CSS_SELECTOR, submit_selector)
-        except NoSuchElementException:
-            candidates = driver.find_elements(By.CSS_SELECTOR, "button, input[type='submit']")
-            for candidate in candidates:
-                text = (candidate.text or candidate.get_attribute("value") or "").lower()
-                if any(k in text for k in ["submit", "enter", "confirm", "join", "register", "enter now"]):
-                    submit_element = candidate
-                    break
-
-        if not submit_element:
-            outcome.aborted_reason = f"Submit button not found using selector '{submit_selector}'."
-            _status(outcome.aborted_reason, status_callback)
-            return outcome
-
-        human_delay(*human_delay_bounds)
         submit_element.click()
         _status("Clicked submit element; waiting for post-submit page.", status_callback)
         time.sleep(3)
         post_screenshot = screenshot_dir / f"autofill_after_submit_{timestamp}.png"
-        driver.save_screenshot(str(post_screenshot))
+        outcome.pending_writes.append(_write_screenshot(driver, post_screenshot))
         outcome.post_submit_screenshot_path = post_screenshot
         outcome.submitted = True
         _status(f"Submitted. Post-submit screenshot saved: {post_screenshot}", status_callback)
@@ -377,11 +630,11 @@ def perform_autofill(
         _status(outcome.error, status_callback)
         return outcome
     finally:
-        try:
-            if closing_delay > 0:
-                time.sleep(closing_delay)
-        except KeyboardInterrupt:
-            pass
-        finally:
-            if driver:
+        if owns_driver:
+            try:
+                if closing_delay > 0:
+                    time.sleep(closing_delay)
+            except KeyboardInterrupt:
+                pass
+            finally:
                 driver.quit()
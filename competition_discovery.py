@@ -16,22 +16,32 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import io
 import logging
+import operator
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
-from urllib.parse import urlparse, urlunparse
-from xml.etree import ElementTree
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlparse
 import os
 import smtplib
 from email.message import EmailMessage
 
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
+from lxml import etree as ElementTree
+from lxml import html as lxml_html
 from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from state_utils import CompetitionState, load_state, save_state
+from state_utils import CompetitionState, append_state, load_state
 
 HEADERS = {
     "User-Agent": (
@@ -42,6 +52,16 @@ HEADERS = {
 
 logger = logging.getLogger("competition_scraper")
 
+HTML_PARSER = "lxml"
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.IGNORECASE)
+
+# Fetches are I/O-bound: a thread pool overlaps them, while the per-host cap keeps
+# us from hammering a single site.
+MAX_FETCH_WORKERS = 16
+MAX_REQUESTS_PER_HOST = 8
+_host_slots: Dict[str, threading.Semaphore] = {}
+_host_slots_lock = threading.Lock()
+
 EXCLUDE_KEYWORDS = (
     "instagram",
     "instagram.com",
@@ -50,6 +70,8 @@ EXCLUDE_KEYWORDS = (
     "tiktok.com",
     "tik tok",
 )
+# One case-insensitive C-level scan per field instead of a substring test per keyword.
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, EXCLUDE_KEYWORDS)), re.IGNORECASE)
 
 
 @dataclass(slots=True)
@@ -64,8 +86,8 @@ class CompetitionEntry:
     is_new: bool = field(default=False, compare=False)
     raw_text: str = ""
 
-    def as_row(self) -> List[str]:
-        return [
+    def as_row(self) -> Tuple[str, ...]:
+        return (
             self.source,
             self.title,
             self.prize,
@@ -74,178 +96,256 @@ class CompetitionEntry:
             self.closing_text,
             "" if self.successful_submission is None else str(self.successful_submission),
             "YES" if self.is_new else "",
-        ]
+        )
 
 
 class CompetitionSource:
     name: str = "Unknown"
+    _session: requests.Session
 
     def fetch(self) -> List[CompetitionEntry]:
         raise NotImplementedError
 
+    def _get(self, url: str) -> requests.Response:
+        with _host_slot(url):
+            response = self._session.get(url, timeout=20)
+        response.raise_for_status()
+        return response
+
+    def _request_text(self, url: str) -> str:
+        return self._get(url).text
+
+    def _request_bytes(self, url: str) -> bytes:
+        # lxml reads the encoding from the XML declaration, and rejects str input
+        # that carries one, so feeds are handed over undecoded.
+        return self._get(url).content
+
+
+def _build_session() -> requests.Session:
+    """Session with pooled keep-alive connections and retries on transient errors."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,  # hand the last response to raise_for_status as before
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _html_encoding(response: requests.Response) -> Optional[str]:
+    """Pick the charset to decode an HTML body with, or None to let lxml read <meta charset>.
+
+    lxml falls back to Latin-1 for byte input without a declaration, and requests
+    assumes ISO-8859-1 for text/* without a header charset, so neither default is
+    trusted on its own.
+    """
+    if "charset" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    if _META_CHARSET_RE.search(response.content[:4096]):
+        return None
+    return response.apparent_encoding
+
+
+def _host_slot(url: str) -> threading.Semaphore:
+    """Semaphore capping concurrent requests to the host of url."""
+    host = urlparse(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.Semaphore(MAX_REQUESTS_PER_HOST)
+    return slot
+
+
+_ORDINAL_RE = re.compile(r"(\d+)(?:st|nd|rd|th)")
+
 
 def _strip_ordinal_suffix(value: str) -> str:
-    return re.sub(r"(\d+)(st|nd|rd|th)", r"\1", value)
+    return _ORDINAL_RE.sub(r"\1", value)
 
 
+@functools.lru_cache(maxsize=1024)
 def _parse_human_date(value: str) -> Optional[dt.date]:
     value = value.strip()
     if not value:
         return None
+    # ISO dates are common in the feeds and never match the strptime formats below.
+    try:
+        return dt.date.fromisoformat(value)
+    except ValueError:
+        pass
     cleaned = _strip_ordinal_suffix(value)
     for fmt in ("%d %b %Y", "%d %B %Y"):
         try:
             return dt.datetime.strptime(cleaned, fmt).date()
         except ValueError:
             continue
-    try:
-        return dt.date.fromisoformat(cleaned)
-    except ValueError:
-        return None
+    return None
 
 
 class CompetitionsTimeSource(CompetitionSource):
     name = "Competitions Time"
     _rss_url = "https://www.competitions-time.co.uk/competitions/rss"
 
+    # Compiled once; pages are plain lxml trees, so the card lookup is a direct id
+    # XPath rather than a BeautifulSoup tree walk per RSS item.
+    _card_xpath = ElementTree.XPath("//*[@id=$slug]")
+    _card_text_xpath = ElementTree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+    _entry_href_xpath = ElementTree.XPath(
+        ".//a[contains(concat(' ', normalize-space(@class), ' '), ' entry-btn ')]/@href"
+    )
+
     def __init__(self) -> None:
-        self._page_cache: Dict[str, BeautifulSoup] = {}
+        self._session = _build_session()
+        self._page_cache: Dict[str, lxml_html.HtmlElement] = {}
 
     def fetch(self) -> List[CompetitionEntry]:
-        logger.info("Fetching RSS from %s", self._rss_url)
-        feed_xml = self._request_text(self._rss_url)
-        root = ElementTree.fromstring(feed_xml)
-
-        entries: List[CompetitionEntry] = []
-        for item in root.findall("./channel/item"):
-            title = _xml_text(item, "title")
-            link = _xml_text(item, "link")
-            if not link:
-                continue
-
-            parsed = urlparse(link)
-            slug = parsed.fragment
-            if not slug:
-                logger.debug("Skipping %s (no fragment/slug to locate card)", link)
-                continue
+        try:
+            logger.info("Fetching RSS from %s", self._rss_url)
+            feed_xml = self._request_bytes(self._rss_url)
+
+            entries: List[CompetitionEntry] = []
+            # Bound once for the per-item loop below.
+            card_xpath = self._card_xpath
+            card_text_xpath = self._card_text_xpath
+            entry_href_xpath = self._entry_href_xpath
+            parse_date = _parse_human_date
+            absolute_url = _absolute_url
+            for title, link in _iter_rss_items(feed_xml):
+                if not link:
+                    continue
 
-            page_key = urlunparse((parsed.scheme, parsed.netloc, parsed.path, "", parsed.query, ""))
-            soup = self._get_page_soup(page_key)
-            card = soup.find(id=slug)
-            if not card:
-                logger.warning("Could not locate competition card '%s' on %s", slug, page_key)
-                continue
+                page_key, _, slug = link.partition("#")
+                if not slug:
+                    logger.debug("Skipping %s (no fragment/slug to locate card)", link)
+                    continue
 
-            lines = list(card.stripped_strings)
-            closing_text = ""
-            closing_date = None
-            prize_text = title.strip()
-
-            for idx, text in enumerate(lines):
-                if text.lower().startswith("closing"):
-                    if idx + 2 < len(lines):
-                        closing_text = lines[idx + 2]
-                        closing_date = _parse_human_date(closing_text)
-                if idx == 3:
-                    prize_text = text
-
-            entry_link = ""
-            button = card.find("a", class_="entry-btn")
-            if button and button.get("href"):
-                entry_link = requests.compat.urljoin(page_key, button["href"])
-
-            raw_text = " ".join(lines).strip()
-            entries.append(
-                CompetitionEntry(
-                    source=self.name,
-                    title=title.strip(),
-                    prize=prize_text.strip(),
-                    link=entry_link or link,
-                    closing_date=closing_date,
-                    closing_text=closing_text.strip(),
-                    successful_submission=False,
-                    raw_text=raw_text,
+                tree = self._get_page_tree(page_key)
+                cards = card_xpath(tree, slug=slug)
+                if not cards:
+                    logger.warning("Could not locate competition card '%s' on %s", slug, page_key)
+                    continue
+                card = cards[0]
+
+                lines = [text.strip() for text in card_text_xpath(card) if text.strip()]
+                closing_text = ""
+                closing_date = None
+                # Card layout: the prize is the fourth line and the date sits two lines
+                # after the "Closing ..." label, so stop scanning at the first label.
+                prize_text = lines[3] if len(lines) > 3 else title.strip()
+                closing_idx = next(
+                    (idx for idx, text in enumerate(lines) if text[:7].casefold() == "closing"),
+                    None,
+                )
+                if closing_idx is not None and closing_idx + 2 < len(lines):
+                    closing_text = lines[closing_idx + 2]
+                    closing_date = parse_date(closing_text)
+
+                entry_link = ""
+                hrefs = entry_href_xpath(card)
+                if hrefs and hrefs[0]:
+                    entry_link = absolute_url(page_key, hrefs[0])
+
+                raw_text = " ".join(lines).strip()
+                entries.append(
+                    CompetitionEntry(
+                        source=self.name,
+                        title=title.strip(),
+                        prize=prize_text.strip(),
+                        link=entry_link or link,
+                        closing_date=closing_date,
+                        closing_text=closing_text.strip(),
+                        successful_submission=False,
+                        raw_text=raw_text,
+                    )
                 )
-            )
-
-        return entries
 
-    def _request_text(self, url: str) -> str:
-        response = requests.get(url, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        return response.text
+            return entries
+        finally:
+            self._session.close()
 
-    def _get_page_soup(self, url: str) -> BeautifulSoup:
+    def _get_page_tree(self, url: str) -> lxml_html.HtmlElement:
         if url not in self._page_cache:
             logger.info("Fetching competitions page %s", url)
-            html = self._request_text(url)
-            self._page_cache[url] = BeautifulSoup(html, "html.parser")
+            response = self._get(url)
+            encoding = _html_encoding(response)
+            parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+            self._page_cache[url] = lxml_html.fromstring(response.content, parser=parser)
         return self._page_cache[url]
 
 
 class PrizeFinderSource(CompetitionSource):
     name = "The Prize Finder"
     _rss_url = "https://www.theprizefinder.com/rss.xml"
+    # Compiled once so each detail page does not re-parse the CSS selectors.
+    _field_sel = soupsieve.compile("div.field")
+    _label_sel = soupsieve.compile("div.field--label")
+    _item_sel = soupsieve.compile("div.field--item")
+    _button_sel = soupsieve.compile(".view-competition-button a")
 
-    def fetch(self) -> List[CompetitionEntry]:
-        logger.info("Fetching RSS from %s", self._rss_url)
-        feed_xml = self._request_text(self._rss_url)
-        root = ElementTree.fromstring(feed_xml)
-
-        entries: List[CompetitionEntry] = []
-        for item in root.findall("./channel/item"):
-            title = _xml_text(item, "title")
-            link = _xml_text(item, "link")
-            if not link:
-                continue
+    def __init__(self) -> None:
+        self._session = _build_session()
 
-            try:
-                detail_html = self._request_text(link)
-            except requests.HTTPError as exc:
-                logger.warning("Failed to fetch detail page %s: %s", link, exc)
+    def fetch(self) -> List[CompetitionEntry]:
+        try:
+            logger.info("Fetching RSS from %s", self._rss_url)
+            feed_xml = self._request_bytes(self._rss_url)
+            items = [(title, link) for title, link in _iter_rss_items(feed_xml) if link]
+
+            # Detail pages are independent, so fetch them concurrently (bounded per host).
+            with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as executor:
+                results = executor.map(lambda item: self._fetch_detail(*item), items)
+                return [entry for entry in results if entry is not None]
+        finally:
+            self._session.close()
+
+    def _fetch_detail(self, title: str, link: str) -> Optional[CompetitionEntry]:
+        try:
+            detail_html = self._request_text(link)
+        except requests.HTTPError as exc:
+            logger.warning("Failed to fetch detail page %s: %s", link, exc)
+            return None
+
+        soup = BeautifulSoup(detail_html, HTML_PARSER)
+        closing_text = ""
+        closing_date = None
+        entry_link = link
+        field_texts: List[str] = []
+
+        for field in self._field_sel.select(soup):
+            label = self._label_sel.select_one(field)
+            content = self._item_sel.select_one(field)
+            if not label or not content:
                 continue
-
-            soup = BeautifulSoup(detail_html, "html.parser")
-            closing_text = ""
-            closing_date = None
-            entry_link = link
-
-            for field in soup.select("div.field"):
-                label = field.select_one("div.field--label")
-                content = field.select_one("div.field--item")
-                if not label or not content:
-                    continue
-                label_text = label.get_text(strip=True)
-                if label_text.startswith("Closing Date"):
-                    closing_text = content.get_text(strip=True)
-                    closing_date = _parse_human_date(closing_text)
-                if label_text.startswith("Website Name"):
-                    entry_link = link
-
-            button = soup.select_one(".view-competition-button a")
-            if button and button.get("href"):
-                entry_link = requests.compat.urljoin(link, button["href"])
-
-            page_text = soup.get_text(" ", strip=True)
-            entries.append(
-                CompetitionEntry(
-                    source=self.name,
-                    title=title.strip(),
-                    prize=title.strip(),
-                    link=entry_link,
-                    closing_date=closing_date,
-                    closing_text=closing_text,
-                    successful_submission=False,
-                    raw_text=page_text,
-                )
-            )
-
-        return entries
-
-    def _request_text(self, url: str) -> str:
-        response = requests.get(url, headers=HEADERS, timeout=20)
-        response.raise_for_status()
-        return response.text
+            label_text = label.get_text(strip=True)
+            content_text = content.get_text(" ", strip=True)
+            field_texts.append(f"{label_text} {content_text}")
+            if label_text.startswith("Closing Date"):
+                closing_text = content.get_text(strip=True)
+                closing_date = _parse_human_date(closing_text)
+            if label_text.startswith("Website Name"):
+                entry_link = link
+
+        button = self._button_sel.select_one(soup)
+        if button and button.get("href"):
+            entry_link = _absolute_url(link, button["href"])
+
+        # Only the competition fields are kept for keyword filtering; the whole page
+        # text (navigation, footer, social links) was large and mostly noise.
+        return CompetitionEntry(
+            source=self.name,
+            title=title.strip(),
+            prize=title.strip(),
+            link=entry_link,
+            closing_date=closing_date,
+            closing_text=closing_text,
+            successful_submission=False,
+            raw_text=" ".join(field_texts),
+        )
 
 
 class BlockedSource(CompetitionSource):
@@ -258,7 +358,23 @@ class BlockedSource(CompetitionSource):
         return []
 
 
-def _xml_text(node: ElementTree.Element, tag: str) -> str:
+def _absolute_url(base: str, href: str) -> str:
+    # Entry buttons usually carry absolute links already; only resolve relative ones.
+    if href.startswith(("https://", "http://")):
+        return href
+    return urljoin(base, href)
+
+
+def _iter_rss_items(feed_xml: bytes) -> Iterator[Tuple[str, str]]:
+    """Yield (title, link) per RSS <item>, freeing each element once it is read."""
+    for _, item in ElementTree.iterparse(io.BytesIO(feed_xml), tag="item"):
+        yield _xml_text(item, "title"), _xml_text(item, "link")
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+
+
+def _xml_text(node: ElementTree._Element, tag: str) -> str:
     child = node.find(tag)
     if child is None or child.text is None:
         return ""
@@ -266,48 +382,60 @@ def _xml_text(node: ElementTree.Element, tag: str) -> str:
 
 
 def _deduplicate(entries: Iterable[CompetitionEntry]) -> List[CompetitionEntry]:
-    dedup: Dict[str, CompetitionEntry] = {}
+    seen = set()
+    unique: List[CompetitionEntry] = []
     for entry in entries:
-        key = _entry_key(entry)
-        if key not in dedup:
-            dedup[key] = entry
-    return list(dedup.values())
+        key = entry.link or entry.title  # same key as _entry_key, inlined for the hot loop
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(entry)
+    return unique
 
 
 def _entry_key(entry: CompetitionEntry) -> str:
     return entry.link or entry.title
 
 
-def _sort(entries: List[CompetitionEntry]) -> List[CompetitionEntry]:
-    def sort_key(item: CompetitionEntry) -> tuple:
-        sentinel = dt.date.max
-        return (item.closing_date or sentinel, item.source, item.title.lower())
+def _has_excluded_keyword(entry: CompetitionEntry) -> bool:
+    fields = (entry.title, entry.prize, entry.link, entry.closing_text, entry.raw_text)
+    return any(_EXCLUDE_RE.search(value) for value in fields if value)
+
 
-    return sorted(entries, key=sort_key)
+def _sort_key(item: CompetitionEntry) -> tuple:
+    return (item.closing_date or dt.date.max, item.source, item.title.casefold())
+
+
+def _sort(entries: List[CompetitionEntry]) -> List[CompetitionEntry]:
+    return sorted(entries, key=_sort_key)
 
 
 def export_to_excel(entries: List[CompetitionEntry], dest: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Competitions"
-    ws.append(
-        [
-            "Source",
-            "Title",
-            "Prize",
-            "Link",
-            "Closing Date (ISO)",
-            "Closing Date (Raw)",
-            "Successful Submission",
-            "Is New This Run",
-        ]
-    )
-    for entry in entries:
-        ws.append(entry.as_row())
-    for column in ws.columns:
-        max_length = max(len(str(cell.value)) if cell.value else 0 for cell in column)
-        column_letter = column[0].column_letter
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 80)
+    # Write-only mode streams rows to the file instead of keeping a Cell object per value.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Competitions")
+    header = [
+        "Source",
+        "Title",
+        "Prize",
+        "Link",
+        "Closing Date (ISO)",
+        "Closing Date (Raw)",
+        "Successful Submission",
+        "Is New This Run",
+    ]
+    rows = [entry.as_row() for entry in entries]
+    # Column widths have to be set before the first row is streamed out.
+    max_widths = [len(name) for name in header]
+    for row in rows:
+        for idx, value in enumerate(row):
+            if value and len(value) > max_widths[idx]:
+                max_widths[idx] = len(value)
+    for idx, width in enumerate(max_widths, start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, 80)
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
     wb.save(dest)
     logger.info("Wrote %d entries to %s", len(entries), dest)
 
@@ -325,7 +453,7 @@ def build_summary(entries: List[CompetitionEntry], new_count: int) -> str:
     ]
     if closing_soon:
         lines.append("Soonest closing entries:")
-        for entry in sorted(closing_soon, key=lambda e: e.closing_date):
+        for entry in sorted(closing_soon, key=operator.attrgetter("closing_date")):
             lines.append(f"- {entry.closing_date}: {entry.title} ({entry.source})")
     return "\n".join(lines)
 
@@ -350,6 +478,7 @@ def send_email(recipients: Sequence[str], summary: str) -> None:
     smtp_user = os.getenv("SMTP_USER")
     smtp_pass = os.getenv("SMTP_PASS")
     smtp_from = os.getenv("SMTP_FROM", smtp_user or "")
+    smtp_starttls = os.getenv("SMTP_STARTTLS", "1") == "1"
 
     if not smtp_host or not smtp_from:
         logger.warning("SMTP configuration incomplete; skipping email notification.")
@@ -362,8 +491,12 @@ def send_email(recipients: Sequence[str], summary: str) -> None:
     msg.set_content(summary)
 
     try:
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=10) as server:
-            server.starttls()
+        # Port 465 is implicit TLS; otherwise upgrade with STARTTLS unless disabled
+        # (e.g. SMTP_STARTTLS=0 for a plaintext localhost relay).
+        smtp_cls = smtplib.SMTP_SSL if smtp_port == 465 else smtplib.SMTP
+        with smtp_cls(smtp_host, smtp_port, timeout=10) as server:
+            if smtp_starttls and smtp_cls is smtplib.SMTP:
+                server.starttls()
             if smtp_user and smtp_pass:
                 server.login(smtp_user, smtp_pass)
             server.send_message(msg)
@@ -389,13 +522,15 @@ def run(
     ]
 
     collected: List[CompetitionEntry] = []
-    for source in sources:
-        try:
-            items = source.fetch()
-            logger.info("Collected %d entries from %s", len(items), source.name)
-            collected.extend(items)
-        except Exception as exc:
-            logger.exception("Failed to collect from %s: %s", source.name, exc)
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [(source, executor.submit(source.fetch)) for source in sources]
+        for source, future in futures:
+            try:
+                items = future.result()
+                logger.info("Collected %d entries from %s", len(items), source.name)
+                collected.extend(items)
+            except Exception as exc:
+                logger.exception("Failed to collect from %s: %s", source.name, exc)
 
     deduped = _sort(_deduplicate(collected))
     if not deduped:
@@ -411,35 +546,25 @@ def run(
         state_path,
     )
 
-    new_count = 0
+    new_keys: List[str] = []
     filtered_entries: List[CompetitionEntry] = []
     suppressed = 0
     excluded = 0
     for entry in deduped:
         key = _entry_key(entry)
-        haystack = " ".join(
-            filter(
-                None,
-                [
-                    entry.title,
-                    entry.prize,
-                    entry.link,
-                    entry.closing_text,
-                    entry.raw_text,
-                ],
-            )
-        ).lower()
-        if any(keyword in haystack for keyword in EXCLUDE_KEYWORDS):
-            excluded += 1
-            continue
+        # Cheap set lookup first; the keyword scan covers the full card/page text.
         if key in state.submitted:
             suppressed += 1
             continue
+        if _has_excluded_keyword(entry):
+            excluded += 1
+            continue
         if key not in state.seen:
             entry.is_new = True
-            new_count += 1
-        state.seen.add(key)
+            new_keys.append(key)
+            state.seen.add(key)
         filtered_entries.append(entry)
+    new_count = len(new_keys)
 
     if suppressed:
         logger.info("Suppressed %d competitions already submitted.", suppressed)
@@ -459,7 +584,7 @@ def run(
     if summary_email:
         send_email(summary_email, summary_text)
 
-    save_state(state_path, state)
+    append_state(state_path, seen=new_keys)
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -5,53 +5,118 @@ PyQt5 GUI front-end for the smart autofill workflow (based on Auto-Fill project)
 
 from __future__ import annotations
 
-import json
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Set
 
 from PyQt5 import QtCore, QtWidgets
 
-from autofill_core import FillAction, load_json, perform_autofill
+from autofill_core import (
+    DEFAULT_SUBMIT_SELECTOR,
+    FillAction,
+    dumps_json,
+    load_json,
+    loads_json,
+    perform_autofill,
+)
 
 
-class AutofillWorker(QtCore.QObject):
+_ACTION_FMT = "%02d. label='%s' tag=%s type=%s score=%s mapped=%s filled=%s value=%s"
+
+
+class AutofillSignals(QtCore.QObject):
     finished = QtCore.pyqtSignal(object)
     failed = QtCore.pyqtSignal(str)
     message = QtCore.pyqtSignal(str)
     request_confirmation = QtCore.pyqtSignal(object, object)
     confirmation_reply = QtCore.pyqtSignal(bool)
 
-    def __init__(self, cfg: Dict[str, Any], data: Dict[str, Any]) -> None:
+
+class AutofillWorker(QtCore.QRunnable):
+    """Runs one autofill pass on a pooled thread; QRunnable cannot emit, so signals live on a companion."""
+
+    def __init__(self) -> None:
         super().__init__()
-        self.cfg = cfg
-        self.data = data
+        # One worker is reused for every run; start_autofill sets cfg/data before each start.
+        self.setAutoDelete(False)
+        self.cfg: Dict[str, Any] = {}
+        self.data: Dict[str, Any] = {}
+        self.signals = AutofillSignals()
+        # The pool thread blocks on the condition until the GUI thread posts the user's answer.
+        self._mutex = QtCore.QMutex()
+        self._reply_ready = QtCore.QWaitCondition()
+        self._reply: bool | None = None
+        self.signals.confirmation_reply.connect(self._on_confirmation_reply)
 
-    @QtCore.pyqtSlot()
     def run(self) -> None:
         try:
             outcome = perform_autofill(
                 self.cfg,
                 self.data,
                 confirm_submit=self._confirm_submit,
-                status_callback=self.message.emit,
+                status_callback=self.signals.message.emit,
             )
-            self.finished.emit(outcome)
+            outcome.wait_for_screenshots()
+            self.signals.finished.emit(outcome)
         except Exception as exc:  # defensive: should not normally happen
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
 
     def _confirm_submit(self, actions: List[FillAction], screenshot_path: Path) -> bool:
-        loop = QtCore.QEventLoop()
-        decision = {"value": False}
+        self._mutex.lock()
+        try:
+            self._reply = None
+            self.signals.request_confirmation.emit(actions, screenshot_path)
+            while self._reply is None:
+                self._reply_ready.wait(self._mutex)
+            return self._reply
+        finally:
+            self._mutex.unlock()
+
+    def _on_confirmation_reply(self, value: bool) -> None:
+        self._mutex.lock()
+        try:
+            self._reply = value
+            self._reply_ready.wakeAll()
+        finally:
+            self._mutex.unlock()
+
+
+class FileTaskSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
 
-        def handle_reply(value: bool) -> None:
-            decision["value"] = value
-            loop.quit()
 
-        self.confirmation_reply.connect(handle_reply)
-        self.request_confirmation.emit(actions, screenshot_path)
-        loop.exec_()
-        self.confirmation_reply.disconnect(handle_reply)
-        return decision["value"]
+class FileTask(QtCore.QRunnable):
+    """Runs a blocking file read/write off the GUI thread and reports the result via signals."""
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = FileTaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.func(*self.args)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+        else:
+            self.signals.done.emit(result)
+
+
+def _write_json_file(path: Path, obj: Any) -> None:
+    # QSaveFile writes to a temporary file and renames on commit, so a failed
+    # save never leaves a truncated config behind.
+    saver = QtCore.QSaveFile(str(path))
+    if not saver.open(QtCore.QIODevice.WriteOnly):
+        raise OSError(saver.errorString())
+    saver.write(dumps_json(obj))
+    if not saver.commit():
+        raise OSError(saver.errorString())
+
+
+def _read_json_text(path: Path) -> str:
+    return dumps_json(load_json(path)).decode("utf-8")
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -62,11 +127,32 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.current_config_path: Path | None = None
         self.current_data_path: Path | None = None
-        self.autofill_thread: QtCore.QThread | None = None
-        self.autofill_worker: AutofillWorker | None = None
+        self._io_signals: Set[FileTaskSignals] = set()
+        # Pooled threads are reused across runs instead of spawning a QThread per click.
+        self.thread_pool = QtCore.QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(2, QtCore.QThread.idealThreadCount() - 3))
+
+        # The worker and its signal wiring live for the whole session.
+        self.autofill_worker = AutofillWorker()
+        # The worker is shared, so at most one run may be queued or active at a time.
+        self._autofill_running = False
+        signals = self.autofill_worker.signals
+        signals.finished.connect(self._cleanup_worker)
+        signals.finished.connect(self._on_autofill_finished)
+        signals.failed.connect(self._cleanup_worker)
+        signals.failed.connect(self._on_autofill_failed)
+        signals.message.connect(self.append_log)
+        signals.request_confirmation.connect(self._on_worker_request_confirmation)
 
         self._build_ui()
 
+        # Log lines are batched and flushed on a timer so a chatty run does not
+        # re-layout the log view once per message.
+        self._log_buffer: deque[str] = deque()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(50)
+
     # --- UI setup helpers -------------------------------------------------
     def _build_ui(self) -> None:
         central = QtWidgets.QWidget(self)
@@ -95,7 +181,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.close_delay_spin.setValue(10.0)
         form_layout.addRow("Close delay (s):", self.close_delay_spin)
 
-        self.submit_selector_edit = QtWidgets.QLineEdit("button[type='submit'], input[type='submit'], button")
+        self.submit_selector_edit = QtWidgets.QLineEdit(DEFAULT_SUBMIT_SELECTOR)
         form_layout.addRow("Submit selector:", self.submit_selector_edit)
 
         delay_layout = QtWidgets.QHBoxLayout()
@@ -159,8 +245,7 @@ class MainWindow(QtWidgets.QMainWindow):
             "url": self.url_edit.text().strip(),
             "headless": self.headless_check.isChecked(),
             "wait_timeout": self.timeout_spin.value(),
-            "submit_selector": self.submit_selector_edit.text().strip()
-            or "button[type='submit'], input[type='submit'], button",
+            "submit_selector": self.submit_selector_edit.text().strip() or DEFAULT_SUBMIT_SELECTOR,
             "human_delay_seconds": [minimum, maximum],
             "close_delay_seconds": float(self.close_delay_spin.value()),
         }
@@ -170,14 +255,29 @@ class MainWindow(QtWidgets.QMainWindow):
         self.headless_check.setChecked(bool(cfg.get("headless", False)))
         self.timeout_spin.setValue(int(cfg.get("wait_timeout", 10)))
         self.close_delay_spin.setValue(float(cfg.get("close_delay_seconds", 10)))
-        self.submit_selector_edit.setText(
-            cfg.get("submit_selector") or "button[type='submit'], input[type='submit'], button"
-        )
+        self.submit_selector_edit.setText(cfg.get("submit_selector") or DEFAULT_SUBMIT_SELECTOR)
         delays = cfg.get("human_delay_seconds", [0.4, 1.0])
         if isinstance(delays, (list, tuple)) and len(delays) == 2:
             self.delay_min_spin.setValue(float(delays[0]))
             self.delay_max_spin.setValue(float(delays[1]))
 
+    def _run_io(
+        self,
+        func: Callable[..., Any],
+        args: tuple,
+        on_done: Callable[[Any], None],
+        error_title: str,
+    ) -> None:
+        task = FileTask(func, *args)
+        signals = task.signals
+        # Keep the signals object alive until the task reports back.
+        self._io_signals.add(signals)
+        signals.done.connect(on_done)
+        signals.failed.connect(lambda message: QtWidgets.QMessageBox.critical(self, error_title, message))
+        signals.done.connect(lambda _: self._io_signals.discard(signals))
+        signals.failed.connect(lambda _: self._io_signals.discard(signals))
+        self.thread_pool.start(task)
+
     def load_config(self) -> None:
         path_str, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Select config JSON", str(Path.cwd()), "JSON Files (*.json)"
@@ -185,14 +285,13 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path_str:
             return
         path = Path(path_str)
-        try:
-            cfg = load_json(path)
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(self, "Error loading config", str(exc))
-            return
-        self._apply_config(cfg)
-        self.current_config_path = path
-        self.status_bar.showMessage(f"Loaded config: {path}", 5000)
+
+        def on_loaded(cfg: Dict[str, Any]) -> None:
+            self._apply_config(cfg)
+            self.current_config_path = path
+            self.status_bar.showMessage(f"Loaded config: {path}", 5000)
+
+        self._run_io(load_json, (path,), on_loaded, "Error loading config")
 
     def save_config(self) -> None:
         path_str, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -202,14 +301,12 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         path = Path(path_str)
         cfg = self._collect_config()
-        try:
-            with open(path, "w", encoding="utf-8") as handle:
-                json.dump(cfg, handle, indent=2)
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(self, "Error saving config", str(exc))
-            return
-        self.current_config_path = path
-        self.status_bar.showMessage(f"Saved config: {path}", 5000)
+
+        def on_saved(_: Any) -> None:
+            self.current_config_path = path
+            self.status_bar.showMessage(f"Saved config: {path}", 5000)
+
+        self._run_io(_write_json_file, (path, cfg), on_saved, "Error saving config")
 
     def load_data(self) -> None:
         path_str, _ = QtWidgets.QFileDialog.getOpenFileName(
@@ -218,22 +315,30 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path_str:
             return
         path = Path(path_str)
-        try:
-            data = load_json(path)
-        except Exception as exc:
-            QtWidgets.QMessageBox.critical(self, "Error loading data", str(exc))
-            return
-        self.data_edit.setPlainText(json.dumps(data, indent=2))
-        self.current_data_path = path
-        self.status_bar.showMessage(f"Loaded data: {path}", 5000)
+
+        def on_loaded(text: str) -> None:
+            self.data_edit.setPlainText(text)
+            self.current_data_path = path
+            self.status_bar.showMessage(f"Loaded data: {path}", 5000)
+
+        self._run_io(_read_json_text, (path,), on_loaded, "Error loading data")
 
     # --- Logging helpers ---------------------------------------------------
     @QtCore.pyqtSlot(str)
     def append_log(self, message: str) -> None:
-        cursor = self.log_output.textCursor()
-        cursor.movePosition(cursor.End)
-        cursor.insertText(message + "\n")
-        self.log_output.ensureCursorVisible()
+        self._log_buffer.append(message)
+
+    def _flush_log(self) -> None:
+        if not self._log_buffer:
+            return
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        # Only follow the tail if the user has not scrolled up to read earlier lines.
+        scrollbar = self.log_output.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+        self.log_output.appendPlainText(text)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def _set_running(self, running: bool) -> None:
         self.load_config_btn.setEnabled(not running)
@@ -247,42 +352,30 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # --- Worker coordination ----------------------------------------------
     def start_autofill(self) -> None:
+        if self._autofill_running:
+            self.status_bar.showMessage("An autofill run is already in progress.", 5000)
+            return
         cfg = self._collect_config()
         if not cfg["url"]:
             QtWidgets.QMessageBox.warning(self, "Missing URL", "Please provide a URL before running autofill.")
             return
         try:
-            data = json.loads(self.data_edit.toPlainText() or "{}")
-        except json.JSONDecodeError as exc:
+            data = loads_json(self.data_edit.toPlainText().encode("utf-8") or b"{}")
+        except ValueError as exc:  # json and orjson decode errors both subclass ValueError
             QtWidgets.QMessageBox.critical(self, "Invalid JSON", f"Data JSON is invalid:\n{exc}")
             return
 
         self.append_log("Starting autofill run…")
         self._set_running(True)
 
-        self.autofill_thread = QtCore.QThread(self)
-        self.autofill_worker = AutofillWorker(cfg, data)
-        self.autofill_worker.moveToThread(self.autofill_thread)
-
-        self.autofill_thread.started.connect(self.autofill_worker.run)
-        self.autofill_worker.finished.connect(self._on_autofill_finished)
-        self.autofill_worker.finished.connect(lambda _: self.autofill_thread.quit())
-        self.autofill_worker.failed.connect(self._on_autofill_failed)
-        self.autofill_worker.failed.connect(lambda _: self.autofill_thread.quit())
-        self.autofill_worker.message.connect(self.append_log)
-        self.autofill_worker.request_confirmation.connect(self._on_worker_request_confirmation)
-        self.autofill_thread.finished.connect(self._cleanup_worker)
-
-        self.autofill_thread.start()
+        self._autofill_running = True
+        self.autofill_worker.cfg = cfg
+        self.autofill_worker.data = data
+        self.thread_pool.start(self.autofill_worker)
 
     def _cleanup_worker(self) -> None:
+        self._autofill_running = False
         self._set_running(False)
-        if self.autofill_worker:
-            self.autofill_worker.deleteLater()
-            self.autofill_worker = None
-        if self.autofill_thread:
-            self.autofill_thread.deleteLater()
-            self.autofill_thread = None
 
     def _on_autofill_finished(self, outcome: Any) -> None:
         self.append_log("Autofill run finished.")
@@ -309,31 +402,40 @@ class MainWindow(QtWidgets.QMainWindow):
         QtWidgets.QMessageBox.critical(self, "Autofill error", message)
 
     def _on_worker_request_confirmation(self, actions_obj: object, screenshot_obj: object) -> None:
-        actions: List[FillAction] = list(actions_obj)
-        screenshot_path = Path(screenshot_obj)
-
-        lines = []
-        for idx, action in enumerate(actions, 1):
-            label = (action.label or "<no label>").strip()
-            lines.append(
-                f"{idx:02d}. label='{label[:60]}' tag={action.tag} type={action.input_type} "
-                f"score={action.score} mapped={action.mapped_key} filled={action.filled} "
-                f"value={str(action.value)[:80]}"
+        actions: List[FillAction] = actions_obj  # already the worker's list; no copy needed
+        screenshot_path = Path(screenshot_obj) if screenshot_obj else None
+
+        details = "\n".join(
+            _ACTION_FMT
+            % (
+                idx,
+                (action.label or "<no label>").strip()[:60],
+                action.tag,
+                action.input_type,
+                action.score,
+                action.mapped_key,
+                action.filled,
+                str(action.value)[:80],
             )
-        details = "\n".join(lines)
+            for idx, action in enumerate(actions, 1)
+        )
 
         msg_box = QtWidgets.QMessageBox(self)
         msg_box.setWindowTitle("Confirm submission")
         msg_box.setIcon(QtWidgets.QMessageBox.Question)
         msg_box.setText("Review the detected fields before submitting automatically.")
-        msg_box.setInformativeText(f"Screenshot saved to:\n{screenshot_path}")
+        if screenshot_path:
+            msg_box.setInformativeText(f"Screenshot saved to:\n{screenshot_path}")
         msg_box.setDetailedText(details or "No actions recorded.")
         msg_box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
         msg_box.setDefaultButton(QtWidgets.QMessageBox.No)
-        result = msg_box.exec_()
+        msg_box.setAttribute(QtCore.Qt.WA_DeleteOnClose)
 
-        if self.autofill_worker:
-            self.autofill_worker.confirmation_reply.emit(result == QtWidgets.QMessageBox.Yes)
+        # open() keeps the dialog window-modal without a nested event loop on the GUI
+        # thread; the worker is released when the dialog reports its result.
+        reply = self.autofill_worker.signals.confirmation_reply
+        msg_box.finished.connect(lambda result: reply.emit(result == QtWidgets.QMessageBox.Yes))
+        msg_box.open()
 
 
 def main() -> None:
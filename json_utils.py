@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+JSON helpers shared by the autofill tools and the state file code.
+
+orjson is used when it is installed (pip install orjson); otherwise the stdlib
+json module takes over with the same output shape. loads_json accepts bytes
+or str either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+
+    loads_json = orjson.loads
+
+    def dumps_json(obj: Any) -> bytes:
+        """Serialise to indented UTF-8 JSON with the fastest available encoder."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # optional accelerator; stdlib json accepts bytes too
+    loads_json = json.loads
+
+    def dumps_json(obj: Any) -> bytes:
+        """Serialise to indented UTF-8 JSON with the fastest available encoder."""
+        return json.dumps(obj, indent=2).encode("utf-8")
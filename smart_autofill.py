@@ -14,18 +14,30 @@ from typing import List
 
 from autofill_core import FillAction, load_json, perform_autofill, logger
 
+_ACTION_FMT = "%02d. label='%s' tag=%s type=%s score=%s mapped=%s filled=%s value_preview=%s"
+
 
 def _print_preview(actions: List[FillAction], screenshot_path: Path) -> None:
     print("\n=== Autofill preview ===")
-    for idx, action in enumerate(actions, 1):
-        label = (action.label or "<no label>").strip()
-        value_preview = (action.value or "")[:60]
+    if actions:
         print(
-            f"{idx:02d}. label='{label[:60]}' tag={action.tag} type={action.input_type} "
-            f"score={action.score} mapped={action.mapped_key} filled={action.filled} "
-            f"value_preview={value_preview}"
+            "\n".join(
+                _ACTION_FMT
+                % (
+                    idx,
+                    (action.label or "<no label>").strip()[:60],
+                    action.tag,
+                    action.input_type,
+                    action.score,
+                    action.mapped_key,
+                    action.filled,
+                    (action.value or "")[:60],
+                )
+                for idx, action in enumerate(actions, 1)
+            )
         )
-    print(f"\nScreenshot saved: {screenshot_path}")
+    if screenshot_path:
+        print(f"\nScreenshot saved: {screenshot_path}")
     print("Please review the browser page. Do not proceed if anything looks wrong.")
     print("You can edit fields manually in the browser before confirming.")
 
@@ -61,6 +73,7 @@ def main() -> None:
         print(f"\nError: {outcome.error}")
         raise SystemExit(1)
 
+    outcome.wait_for_screenshots()
     print("\n=== Run summary ===")
     print(f"Submitted: {outcome.submitted}")
     if outcome.screenshot_path:
@@ -9,39 +9,68 @@ State file format:
   "submitted": ["link3"]
 }
 
+New links are appended to a sibling `.jsonl` log (one `{"seen": link}` or
+`{"submitted": link}` object per line) instead of rewriting the snapshot on
+every update. `load_state` replays the log on top of the snapshot, and the log
+is folded back into the snapshot once it outgrows it. The log is single-writer:
+no file lock is taken, so only one discovery/runner process may update a given
+state file at a time.
+
 Legacy files with an `entries` list are still supported.
 """
 
 from __future__ import annotations
 
-import datetime as dt
 import json
 import logging
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable
+
+from sortedcontainers import SortedSet
+
+from json_utils import loads_json
 
 logger = logging.getLogger("state_utils")
 
+# Compact once the append log is this many times larger than the snapshot
+# (never below COMPACT_MIN_BYTES, so small state files are not rewritten constantly).
+COMPACT_RATIO = 4
+COMPACT_MIN_BYTES = 64 * 1024
+
 
 @dataclass
 class CompetitionState:
-    seen: Set[str]
-    submitted: Set[str]
+    # Kept ordered as links are added so save_state never has to sort.
+    seen: SortedSet
+    submitted: SortedSet
 
 
-def _normalize_keys(entries: Iterable[str]) -> Set[str]:
-    return {str(item).strip() for item in entries if isinstance(item, str) and str(item).strip()}
+def _normalize_keys(entries: Iterable[str]) -> SortedSet:
+    # Strip each key once and let filter() drop the empties in C.
+    return SortedSet(filter(None, (item.strip() for item in entries if isinstance(item, str))))
+
+
+def _log_path(path: Path) -> Path:
+    return path.with_suffix(".jsonl")
 
 
 def load_state(path: Path) -> CompetitionState:
+    state = _load_snapshot(path)
+    _replay_log(_log_path(path), state)
+    return state
+
+
+def _load_snapshot(path: Path) -> CompetitionState:
     if not path.exists():
-        return CompetitionState(set(), set())
+        return CompetitionState(SortedSet(), SortedSet())
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = loads_json(path.read_bytes())
     except Exception as exc:
         logger.warning("Failed to parse state file %s: %s", path, exc)
-        return CompetitionState(set(), set())
+        return CompetitionState(SortedSet(), SortedSet())
 
     if isinstance(data, dict):
         if "seen" in data or "submitted" in data:
@@ -50,17 +79,67 @@ def load_state(path: Path) -> CompetitionState:
             return CompetitionState(seen, submitted)
         if "entries" in data:  # legacy format
             seen = _normalize_keys(data.get("entries", []))
-            return CompetitionState(seen, set())
+            return CompetitionState(seen, SortedSet())
 
     logger.warning("State file %s has unexpected format; starting fresh.", path)
-    return CompetitionState(set(), set())
+    return CompetitionState(SortedSet(), SortedSet())
+
+
+def _replay_log(log_path: Path, state: CompetitionState) -> None:
+    if not log_path.exists():
+        return
+    with open(log_path, "rb") as handle:
+        for line in handle:
+            try:
+                record = loads_json(line)
+            except ValueError:  # e.g. a half-written last line after a crash
+                logger.debug("Ignoring malformed state log line in %s", log_path)
+                continue
+            if not isinstance(record, dict):
+                continue
+            state.seen.update(_normalize_keys([record.get("seen")]))
+            state.submitted.update(_normalize_keys([record.get("submitted")]))
+
+
+def append_state(path: Path, *, seen: Iterable[str] = (), submitted: Iterable[str] = ()) -> None:
+    """Record newly seen/submitted links without rewriting the whole state file."""
+    records = [{"seen": key} for key in seen] + [{"submitted": key} for key in submitted]
+    if not records:
+        return
+    log_path = _log_path(path)
+    payload = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+    with open(log_path, "a+b") as handle:
+        # A crash can leave a torn last line; start on a fresh line so the new
+        # records are not merged into it and discarded on replay.
+        if handle.seek(0, os.SEEK_END) > 0:
+            handle.seek(-1, os.SEEK_END)
+            if handle.read(1) != b"\n":
+                payload = "\n" + payload
+        handle.write(payload.encode("utf-8"))
+    logger.info("Appended %d state updates to %s", len(records), log_path)
+
+    snapshot_size = path.stat().st_size if path.exists() else 0
+    if log_path.stat().st_size > COMPACT_RATIO * max(snapshot_size, COMPACT_MIN_BYTES):
+        save_state(path, load_state(path))
+
+
+def _utc_timestamp() -> str:
+    """UTC ISO-8601 timestamp (microsecond precision) without building a datetime."""
+    ns = time.time_ns()
+    seconds, micros = divmod(ns // 1000, 1_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{micros:06d}"
 
 
 def save_state(path: Path, state: CompetitionState) -> None:
+    """Write a full snapshot atomically and drop the append log it supersedes."""
     payload = {
-        "generated_at": dt.datetime.utcnow().isoformat(),
-        "seen": sorted(state.seen),
-        "submitted": sorted(state.submitted),
+        "generated_at": _utc_timestamp(),
+        "seen": list(state.seen),
+        "submitted": list(state.submitted),
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    # Machine-read file: compact separators keep it small and skip the indenting encoder.
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+    _log_path(path).unlink(missing_ok=True)
     logger.info("Updated state file %s", path)
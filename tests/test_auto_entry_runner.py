@@ -0,0 +1,153 @@
+import json
+import re
+import zipfile
+
+import pytest
+
+from openpyxl import Workbook
+
+import auto_entry_runner
+from auto_entry_runner import run
+from autofill_core import AutofillOutcome
+
+
+def _strip_dimension(path):
+    # Mimic workbooks from tools that omit <dimension>, which makes read-only rows ragged.
+    with zipfile.ZipFile(path) as src:
+        members = {name: src.read(name) for name in src.namelist()}
+    sheet = "xl/worksheets/sheet1.xml"
+    members[sheet] = re.sub(rb"<dimension[^>]*/>", b"", members[sheet])
+    with zipfile.ZipFile(path, "w") as dst:
+        for name, data in members.items():
+            dst.writestr(name, data)
+
+
+def _write_inputs(tmp_path, rows):
+    workbook_path = tmp_path / "entries.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Source", "Title", "Successful Submission", "Link"])
+    for row in rows:
+        ws.append(row)
+    wb.save(workbook_path)
+
+    (tmp_path / "c.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "d.json").write_text("{}", encoding="utf-8")
+    targets_path = tmp_path / "targets.json"
+    targets_path.write_text(
+        json.dumps(
+            {
+                "targets": [
+                    {"match": "example.com", "config": str(tmp_path / "c.json"), "data": str(tmp_path / "d.json")}
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    return workbook_path, targets_path
+
+
+def test_short_rows_do_not_abort_the_scan(tmp_path, capsys):
+    workbook_path, targets_path = _write_inputs(
+        tmp_path, [["CT", "Short row"], ["CT", "Match", "", "https://example.com/comp/1"]]
+    )
+    _strip_dimension(workbook_path)
+
+    assert run(workbook_path, targets_path, dry_run=True, auto_yes=False, limit=None) == []
+    assert "Would submit: https://example.com/comp/1" in capsys.readouterr().out
+
+
+class _FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def test_crashed_browser_is_replaced_before_the_next_row(tmp_path, monkeypatch):
+    workbook_path, targets_path = _write_inputs(
+        tmp_path,
+        [["CT", "One", "", "https://example.com/comp/1"], ["CT", "Two", "", "https://example.com/comp/2"]],
+    )
+    drivers = []
+
+    def fake_create_driver(cfg):
+        drivers.append(_FakeDriver())
+        return drivers[-1]
+
+    def fake_perform_autofill(cfg, data, confirm_submit=None, driver=None):
+        if len(drivers) == 1:
+            driver.alive = False  # Chrome dies during the first row
+            return AutofillOutcome(fill_actions=[], error="invalid session id")
+        return AutofillOutcome(fill_actions=[], submitted=True)
+
+    monkeypatch.setattr(auto_entry_runner, "create_driver", fake_create_driver)
+    monkeypatch.setattr(auto_entry_runner, "perform_autofill", fake_perform_autofill)
+    monkeypatch.setattr(auto_entry_runner, "session_alive", lambda driver: driver.alive)
+    monkeypatch.setattr(auto_entry_runner, "reset_session", lambda driver: None)
+
+    submitted = run(workbook_path, targets_path, dry_run=False, auto_yes=True, limit=None)
+
+    assert submitted == ["https://example.com/comp/2"]
+    assert len(drivers) == 2
+    assert [d.quit_calls for d in drivers] == [1, 1]
+
+
+def test_empty_sheet_reports_missing_columns(tmp_path):
+    workbook_path = tmp_path / "empty.xlsx"
+    Workbook().save(workbook_path)
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    _, targets_path = _write_inputs(inputs, [])
+
+    with pytest.raises(ValueError, match="missing expected columns"):
+        run(workbook_path, targets_path, dry_run=True, auto_yes=False, limit=None)
+
+
+def test_rows_with_other_browser_options_get_their_own_session(tmp_path, monkeypatch):
+    workbook_path = tmp_path / "entries.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Source", "Title", "Successful Submission", "Link"])
+    ws.append(["CT", "One", "", "https://headless.example/comp/1"])
+    ws.append(["CT", "Two", "", "https://visible.example/comp/2"])
+    wb.save(workbook_path)
+    (tmp_path / "headless.json").write_text(json.dumps({"headless": True}), encoding="utf-8")
+    (tmp_path / "visible.json").write_text(json.dumps({"headless": False}), encoding="utf-8")
+    (tmp_path / "d.json").write_text("{}", encoding="utf-8")
+    targets_path = tmp_path / "targets.json"
+    targets_path.write_text(
+        json.dumps(
+            {
+                "defaults": {"data": str(tmp_path / "d.json")},
+                "targets": [
+                    {"match": "headless.example", "config": str(tmp_path / "headless.json")},
+                    {"match": "visible.example", "config": str(tmp_path / "visible.json")},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    drivers = []
+    runs = []
+
+    def fake_create_driver(cfg):
+        drivers.append(_FakeDriver())
+        drivers[-1].headless = cfg["headless"]
+        return drivers[-1]
+
+    def fake_perform_autofill(cfg, data, confirm_submit=None, driver=None):
+        runs.append((cfg["headless"], driver.headless))
+        return AutofillOutcome(fill_actions=[])
+
+    monkeypatch.setattr(auto_entry_runner, "create_driver", fake_create_driver)
+    monkeypatch.setattr(auto_entry_runner, "perform_autofill", fake_perform_autofill)
+    monkeypatch.setattr(auto_entry_runner, "session_alive", lambda driver: driver.alive)
+    monkeypatch.setattr(auto_entry_runner, "reset_session", lambda driver: None)
+
+    run(workbook_path, targets_path, dry_run=False, auto_yes=True, limit=None)
+
+    assert runs == [(True, True), (False, False)]
+    assert [d.quit_calls for d in drivers] == [1, 1]
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+
+from autofill_core import find_visible_inputs
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="module")
+def driver():
+    webdriver = pytest.importorskip("selenium.webdriver")
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    try:
+        drv = webdriver.Chrome(options=options)
+    except Exception as exc:  # no Chrome/ChromeDriver on this machine
+        pytest.skip(f"Chrome unavailable: {exc}")
+    yield drv
+    drv.quit()
+
+
+def test_harvest_skips_honeypot_fields(driver):
+    driver.get((FIXTURES / "honeypot_form.html").as_uri())
+
+    ids = {meta["id"] for meta in find_visible_inputs(driver)}
+
+    assert "email" in ids
+    assert not ids & {"hp-opacity", "hp-opacity-parent", "hp-offscreen", "hp-hidden-parent"}
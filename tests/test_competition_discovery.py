@@ -0,0 +1,32 @@
+import requests
+
+from competition_discovery import CompetitionsTimeSource
+
+
+def _html_response(body: bytes, content_type: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_page_without_charset_declaration_decodes_as_utf8():
+    body = "<html><body><div id='car-1'><p>£500 café voucher up for grabs this week</p></div></body></html>"
+    source = CompetitionsTimeSource()
+    source._get = lambda url: _html_response(body.encode("utf-8"), "text/html")
+
+    tree = source._get_page_tree("https://ct.example/comps")
+
+    assert "£500 café" in tree.text_content()
+
+
+def test_header_charset_wins_over_detection():
+    body = "<html><body><p>£500 café</p></body></html>"
+    source = CompetitionsTimeSource()
+    source._get = lambda url: _html_response(body.encode("cp1252"), "text/html; charset=windows-1252")
+
+    tree = source._get_page_tree("https://ct.example/comps")
+
+    assert "£500 café" in tree.text_content()
@@ -0,0 +1,21 @@
+from state_utils import append_state, load_state, save_state
+
+
+def test_append_after_torn_line_survives_replay_and_compaction(tmp_path):
+    path = tmp_path / "competition_state.json"
+    append_state(path, seen=["https://a.example"])
+    # Simulate a crash part-way through writing a record.
+    with open(path.with_suffix(".jsonl"), "ab") as handle:
+        handle.write(b'{"seen":"https://tor')
+
+    append_state(path, seen=["https://b.example"], submitted=["https://b.example"])
+
+    state = load_state(path)
+    assert set(state.seen) == {"https://a.example", "https://b.example"}
+    assert set(state.submitted) == {"https://b.example"}
+
+    save_state(path, state)
+    assert not path.with_suffix(".jsonl").exists()
+    compacted = load_state(path)
+    assert set(compacted.seen) == {"https://a.example", "https://b.example"}
+    assert set(compacted.submitted) == {"https://b.example"}